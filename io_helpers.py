@@ -0,0 +1,113 @@
+# io_helpers.py — κοινοί cached loaders για τα Streamlit apps
+# (μία function identity => ένα cache entry, όσες σελίδες κι αν τα κάνουν import)
+
+import os, numpy as np, pandas as pd, streamlit as st
+
+# ένα scandir αντί για glob: το DirEntry δίνει name/is_file χωρίς stat ανά match,
+# και το cache key (dir mtime) γλιτώνει το directory walk στα reruns·
+# το parsing κλειδώνεται σε (path, mtime): τα χθεσινά αρχεία δεν ξαναδιαβάζονται ποτέ
+@st.cache_data(show_spinner=False)
+def _list_track_files(track_dir: str, dir_mtime: int) -> list:
+    entries = [
+        e.name for e in os.scandir(track_dir)
+        if e.name.startswith("mmv_track_streams_") and e.name.endswith(".csv") and e.is_file()
+    ]
+    dedup = sorted(n for n in entries if n.endswith("_deduped.csv"))
+    raw = sorted(n for n in entries if not n.endswith("_deduped.csv"))
+    # YYYY-MM-DD στο όνομα -> η λεξικογραφική ταξινόμηση είναι και χρονολογική
+    return [os.path.join(track_dir, n) for n in (dedup or raw)]
+
+# διαβάζουμε μόνο τις στήλες που χρησιμοποιούμε, με σωστό dtype από τον C parser
+# (projection pushdown: κανένα post-parse to_numeric/astype πέρασμα)
+_TRACK_COLS = {"title","plays","total","cover_url","release_date","duration","isrc","daily_delta","No","_key"}
+
+@st.cache_data(show_spinner=False)
+def _read_track_csv(path: str, mtime: float) -> pd.DataFrame:
+    # αν ο scraper έχει γράψει parquet sidecar, προτίμησέ το: typed columnar read,
+    # με έτοιμο _key — κανένα dtype fixup
+    pq = path[:-4] + ".parquet"
+    if os.path.exists(pq):
+        try:
+            return pd.read_parquet(pq)
+        except Exception:
+            pass
+    return pd.read_csv(
+        path,
+        usecols=lambda c: c.lstrip("﻿") in _TRACK_COLS,
+        dtype={"plays": "Int64", "daily_delta": "Int64"},
+        encoding="utf-8-sig",
+    )
+
+@st.cache_data(show_spinner=False)
+def load_totals_csv(path: str, mtime: float) -> pd.DataFrame:
+    df = pd.read_csv(
+        path,
+        usecols=lambda c: c.lower().lstrip("﻿") in {"date","total_plays","daily_delta","source"},
+        dtype={"total_plays": "Int64", "daily_delta": "Int64"},
+        parse_dates=["date"],
+        encoding="utf-8-sig",
+    )
+    df = df.dropna(subset=["date"]).sort_values("date")
+    if "daily_delta" in df.columns:
+        df["daily_delta"] = df["daily_delta"].fillna(0)
+    else:
+        df["daily_delta"] = 0
+    return df
+
+def keyify(d: pd.DataFrame) -> pd.Series:
+    # πιστό mirror του scraper key: normalized τίτλος + διάρκεια σε ΔΕΥΤΕΡΟΛΕΠΤΑ
+    # (όχι το raw "3:41" — αλλιώς δεν συγκρίνεται με τα αποθηκευμένα _key)
+    k = (d["title"].fillna("").astype(str)
+          .str.normalize("NFKD")
+          .str.replace("[\u0300-\u036f]", "", regex=True)  # όχι raw string: το RE2 (Arrow strings) δεν δέχεται \u escapes
+          .str.lower()
+          .str.replace(r"\s+", " ", regex=True)
+          .str.strip())
+    if "duration" in d.columns:
+        txt = d["duration"].astype(str).str.strip()
+        m = txt.str.extract(r"^(\d+):(\d{1,2})$")
+        sec = pd.to_numeric(m[0], errors="coerce").astype("Int64") * 60 \
+            + pd.to_numeric(m[1], errors="coerce").astype("Int64")
+        sec = sec.fillna(pd.to_numeric(txt, errors="coerce").round().astype("Int64"))
+        # ίδιο fill με τον scraper ("None"), κατά γράμμα: NA διάρκεια αλλιώς
+        # δίνει NaN key και τα reindex lookups του add_daily_change αστοχούν
+        k = k.str.cat(sec.astype("string").fillna("None"), sep="|")
+    return k
+
+def add_daily_change(today: pd.DataFrame, prev: pd.DataFrame) -> pd.DataFrame:
+    # indexed lookup αντί για pd.merge: ένα hash build στο prev, ένα reindex στο today,
+    # χωρίς βοηθητικές στήλες/merged frame. Το αποθηκευμένο _key χρησιμοποιείται
+    # μόνο όταν το έχουν ΚΑΙ τα δύο frames — αλλιώς keyify και στα δύο, ώστε τα
+    # κλειδιά να προέρχονται πάντα από την ίδια πηγή
+    if "_key" in today.columns and "_key" in prev.columns:
+        today_key, prev_key = today["_key"].astype(str), prev["_key"].astype(str)
+    else:
+        today_key, prev_key = keyify(today), keyify(prev)
+    prev_plays = prev.set_index(prev_key)["plays"]
+    prev_plays = prev_plays[~prev_plays.index.duplicated(keep="first")]
+    aligned = prev_plays.reindex(today_key).fillna(0).to_numpy(dtype=np.int64)
+    today = today.copy()
+    today["daily_delta"] = today["plays"].fillna(0).to_numpy(dtype=np.int64) - aligned
+    return today
+
+def load_latest_tracks(dirpath: str) -> pd.DataFrame:
+    if not os.path.isdir(dirpath):
+        return pd.DataFrame(columns=["title","plays","cover_url","release_date","daily_delta"])
+    files = _list_track_files(dirpath, os.stat(dirpath).st_mtime_ns)
+    if not files:
+        return pd.DataFrame(columns=["title","plays","cover_url","release_date","daily_delta"])
+    df = _read_track_csv(files[-1], os.path.getmtime(files[-1]))
+    if "plays" not in df and "total" in df:
+        df.rename(columns={"total":"plays"}, inplace=True)
+        df["plays"] = pd.to_numeric(df["plays"], errors="coerce")
+    df["plays"] = df["plays"].fillna(0).astype("Int64")
+    if "daily_delta" not in df.columns:
+        if len(files) >= 2:
+            prev = _read_track_csv(files[-2], os.path.getmtime(files[-2]))
+            df = add_daily_change(df, prev)
+        else:
+            df["daily_delta"] = 0
+    # category: οι τίτλοι επαναλαμβάνονται κάθε μέρα — int codes αντί για ~100B strings
+    df["title"] = df.get("title").astype(str).astype("category")
+    df["cover_url"] = df.get("cover_url")
+    return df
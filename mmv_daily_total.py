@@ -1,210 +1,324 @@
-# mmv_daily_total.py — scrape MMV, dedupe, exclude specific tracks, save covers, update totals
-# (Excludes: "Mouri" + "Sta Hronia Tis Ipomonis - Remastered 2005")
-
-import os, re, time, unicodedata
-import datetime as dt
-from typing import Optional
-import requests
-import pandas as pd
-from bs4 import BeautifulSoup
-
-# ---------- CONFIG ----------
-ARTIST_URL = "https://www.musicmetricsvault.com/artists/anna-vissi/3qg78gggwp04ytv0zqmsxl"
-OUT_TOTAL_CSV = "mmv_total_streams.csv"
-OUT_TRACKS_DIR = "mmv_tracks_daily"
-HEADERS = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"}
-
-# ---------- EXCLUSIONS ----------
-# κανονικοποιούμε τίτλους (lower + χωρίς τόνους) πριν το matching
-EXCLUDE_PATTERNS = [
-    r"\bmouri\b",
-    r"\bμουρη\b",
-    r"\bμούρη\b",
-    r"\bsta hronia tis ipomonis\s*-\s*remastered\s*2005\b",  # ακριβώς αυτός ο τίτλος/έκδοση
-]
-
-# ---------- HELPERS ----------
-def fetch(url: str, retries: int = 3, wait: int = 2) -> str:
-    last_err = None
-    for i in range(retries):
-        print(f"[fetch] GET {url} (try {i+1}/{retries})")
-        try:
-            r = requests.get(url, headers=HEADERS, timeout=30)
-            print(f"[fetch] status={r.status_code}")
-            if r.status_code == 200:
-                return r.text
-            last_err = f"HTTP {r.status_code}"
-        except Exception as e:
-            last_err = str(e)
-        time.sleep(wait)
-    raise RuntimeError(f"Fetch failed: {last_err}")
-
-def parse_human_int(s: str) -> Optional[int]:
-    if s is None:
-        return None
-    s = str(s).strip().replace(",", "")
-    return int(s) if s.isdigit() else None
-
-def parse_duration_to_seconds(s: str) -> Optional[int]:
-    if s is None: return None
-    s = str(s).strip()
-    m = re.match(r"^(\d+):(\d{1,2})$", s)
-    if m: return int(m.group(1)) * 60 + int(m.group(2))
-    try: return int(round(float(s)))
-    except Exception: return None
-
-def strip_accents(x: str) -> str:
-    return "".join(c for c in unicodedata.normalize("NFD", x) if unicodedata.category(c) != "Mn")
-
-def norm_title_preserve_version(t: str) -> str:
-    t = str(t or "").strip().lower()
-    t = strip_accents(t)
-    t = re.sub(r"\s+", " ", t)
-    return t
-
-def make_dedupe_key(title: str, duration: str) -> str:
-    return f"{norm_title_preserve_version(title)}|{parse_duration_to_seconds(duration)}"
-
-def should_exclude(title: str) -> bool:
-    nt = norm_title_preserve_version(title)  # lowercase + χωρίς τόνους
-    return any(re.search(p, nt, flags=re.IGNORECASE) for p in EXCLUDE_PATTERNS)
-
-def find_tracks_table(soup: BeautifulSoup):
-    for idx, tbl in enumerate(soup.find_all("table"), start=1):
-        headers = [th.get_text(strip=True).lower() for th in tbl.find_all("th")]
-        if {"track", "plays", "duration", "release date"}.issubset(set(headers)):
-            return tbl
-    return None
-
-def table_to_dataframe(tbl: BeautifulSoup) -> pd.DataFrame:
-    # helper: πιάσε URL εικόνας και από lazy attrs
-    def extract_img_url(td):
-        img = td.find("img")
-        if not img:
-            return None
-        for attr in ("src", "data-src", "data-lazy", "data-original"):
-            val = img.get(attr)
-            if val and isinstance(val, str) and val.strip():
-                if val.startswith("//"):  # protocol-relative
-                    val = "https:" + val
-                return val
-        return None
-
-    headers = [th.get_text(strip=True) for th in tbl.find_all("th")]
-    rows = []
-    for tr in tbl.find_all("tr"):
-        tds = tr.find_all("td")
-        if not tds or len(tds) < len(headers):
-            continue
-
-        cells = [td.get_text(" ", strip=True) for td in tds[:len(headers)]]
-        cover_url = extract_img_url(tds[0]) if tds else None
-        rows.append(cells + [cover_url])
-
-    cols = [h.strip().lower().replace(" ", "_") for h in headers] + ["cover_url"]
-    df = pd.DataFrame(rows, columns=cols)
-    df = df.rename(columns={
-        "track": "title",
-        "plays": "plays",
-        "duration": "duration",
-        "release_date": "release_date"
-    })
-    df["plays"] = df["plays"].apply(parse_human_int)
-    df = df.dropna(subset=["title", "plays"])
-    return df
-
-# ---------- MAIN ----------
-def main():
-    print("▶ START mmv_daily_total.py")
-    html = fetch(ARTIST_URL)
-
-    try:
-        soup = BeautifulSoup(html, "lxml")
-    except Exception:
-        soup = BeautifulSoup(html, "html.parser")
-
-    tbl = find_tracks_table(soup)
-    if not tbl:
-        print("✗ No valid table found.")
-        return
-
-    df = table_to_dataframe(tbl)
-
-    # 1) Exclude συγκεκριμένους τίτλους (Mouri + Remastered 2005)
-    before = len(df)
-    df = df[~df["title"].apply(should_exclude)]
-    removed = before - len(df)
-    print(f"[exclude] removed={removed}")
-
-    # 2) Save RAW της ημέρας
-    today_str = dt.date.today().strftime("%Y-%m-%d")
-    os.makedirs(OUT_TRACKS_DIR, exist_ok=True)
-    raw_path = os.path.join(OUT_TRACKS_DIR, f"mmv_track_streams_{today_str}.csv")
-    df.to_csv(raw_path, index=False, encoding="utf-8-sig")
-    print(f"[save] RAW -> {raw_path} (rows={len(df)})")
-
-    # 3) DEDUPE: ίδιος normalized τίτλος + ίδια διάρκεια => κρατάμε max plays
-    df["_key"] = df.apply(lambda r: make_dedupe_key(r.get("title"), r.get("duration")), axis=1)
-    df_dedup = (
-        df.sort_values("plays", ascending=False)
-          .groupby("_key", as_index=False)
-          .agg(
-              title=("title", "first"),
-              plays=("plays", "max"),
-              duration=("duration", "first"),
-              release_date=("release_date", "first"),
-              cover_url=("cover_url", "first"),
-          )
-    )
-
-    # 4) (προαιρετική) αρίθμηση για ευκολότερο display στο app
-    df_dedup.insert(0, "No", range(1, len(df_dedup) + 1))
-
-    dedup_path = os.path.join(OUT_TRACKS_DIR, f"mmv_track_streams_{today_str}_deduped.csv")
-    df_dedup.to_csv(dedup_path, index=False, encoding="utf-8-sig")
-    print(f"[save] DEDUPED -> {dedup_path} (rows={len(df_dedup)})")
-
-    # 5) Σύνολο (χωρίς τα excluded + χωρίς duplicates)
-    deduped_total = int(df_dedup["plays"].fillna(0).astype(int).sum())
-    print(f"[total] deduped_total={deduped_total:,}")
-
-    # 6) Ενημέρωση/αντικατάσταση σημερινής γραμμής στο totals CSV
-    header = "date,total_plays,daily_delta,source\n"
-    lines = []
-    prev_total = None
-
-    if os.path.exists(OUT_TOTAL_CSV):
-        with open(OUT_TOTAL_CSV, "r", encoding="utf-8-sig") as f:
-            lines = [ln for ln in f.readlines() if ln.strip()]
-        for ln in reversed(lines):
-            if not ln.startswith("date,") and not ln.startswith(today_str + ","):
-                try:
-                    prev_total = int(ln.split(",")[1])
-                    break
-                except Exception:
-                    pass
-
-    daily_delta = 0 if prev_total is None else (deduped_total - prev_total)
-    today_line = f"{today_str},{deduped_total},{daily_delta},MusicMetricsVault.com (personal use)\n"
-
-    if not lines:
-        with open(OUT_TOTAL_CSV, "w", encoding="utf-8-sig") as f:
-            f.write(header + today_line)
-    else:
-        replaced = False
-        for i in range(len(lines) - 1, -1, -1):
-            if lines[i].startswith(today_str + ","):
-                lines[i] = today_line
-                replaced = True
-                break
-        if not replaced:
-            lines.append(today_line)
-        with open(OUT_TOTAL_CSV, "w", encoding="utf-8-sig") as f:
-            if not lines[0].startswith("date,"):
-                f.write(header)
-            f.writelines([ln if ln.endswith("\n") else (ln + "\n") for ln in lines])
-
-    print("✅ DONE")
-
-if __name__ == "__main__":
+# mmv_daily_total.py — scrape MMV, dedupe, exclude specific tracks, save covers, update totals
+# (Excludes: "Mouri" + "Sta Hronia Tis Ipomonis - Remastered 2005")
+
+import io, os, re, time, unicodedata
+import datetime as dt
+from functools import lru_cache
+from typing import Optional
+import requests
+from requests.adapters import HTTPAdapter
+import pandas as pd
+from bs4 import BeautifulSoup, SoupStrainer
+
+# fail fast στο import: χωρίς lxml θα σκάγαμε στα μισά του run (μετά το fetch),
+# ή χειρότερα θα πέφταμε σιωπηλά στον ~10x αργότερο html.parser
+try:
+    import lxml  # noqa: F401
+except ImportError as e:
+    raise ImportError("mmv_daily_total.py requires lxml (pip install lxml)") from e
+
+# ---------- CONFIG ----------
+ARTIST_URL = "https://www.musicmetricsvault.com/artists/anna-vissi/3qg78gggwp04ytv0zqmsxl"
+OUT_TOTAL_CSV = "mmv_total_streams.csv"
+OUT_TRACKS_DIR = "mmv_tracks_daily"
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)",
+    "Accept-Encoding": "gzip, deflate",
+}
+
+# ένα Session με keep-alive: τα retries δεν ξαναπληρώνουν TCP+TLS handshake
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0))
+
+# ---------- EXCLUSIONS ----------
+# κανονικοποιούμε τίτλους (lower + χωρίς τόνους) πριν το matching
+EXCLUDE_PATTERNS = [
+    r"\bmouri\b",
+    r"\bμουρη\b",
+    r"\bμούρη\b",
+    r"\bsta hronia tis ipomonis\s*-\s*remastered\s*2005\b",  # ακριβώς αυτός ο τίτλος/έκδοση
+]
+# ένα compiled alternation αντί για loop N patterns ανά τίτλο·
+# χωρίς IGNORECASE (οι τίτλοι είναι ήδη lowercased) και χωρίς re.ASCII —
+# το \b γύρω από τα ελληνικά patterns χρειάζεται Unicode word semantics
+_EXCLUDE_RE = re.compile("|".join(f"(?:{p})" for p in EXCLUDE_PATTERNS))
+_WS_RE = re.compile(r"\s+")
+
+# ---------- HELPERS ----------
+def fetch(url: str, retries: int = 3, wait: int = 2) -> requests.Response:
+    # stream=True: το body πάει κατευθείαν στον lxml parser, χωρίς ενδιάμεσο str
+    last_err = None
+    for i in range(retries):
+        print(f"[fetch] GET {url} (try {i+1}/{retries})")
+        try:
+            r = SESSION.get(url, timeout=30, stream=True)
+            print(f"[fetch] status={r.status_code}")
+            if r.status_code == 200:
+                r.raw.decode_content = True  # διάφανο gzip/deflate
+                return r
+            r.close()
+            last_err = f"HTTP {r.status_code}"
+        except Exception as e:
+            last_err = str(e)
+        time.sleep(wait)
+    raise RuntimeError(f"Fetch failed: {last_err}")
+
+# precompiled μία φορά — όχι re.match compile ανά κελί· το k/m/b path είναι fallback
+_NUM_RE = re.compile(r"^([\d.]+)\s*([kmb])?$")
+_MULT = {"": 1, "k": 1_000, "m": 1_000_000, "b": 1_000_000_000}
+
+def parse_human_int(s: str) -> Optional[int]:
+    if s is None:
+        return None
+    s = str(s).strip().lower().replace(",", "")
+    if s.isdigit():  # κοινή περίπτωση MMV: σκέτος ακέραιος, χωρίς regex
+        return int(s)
+    m = _NUM_RE.match(s)
+    if not m:
+        return None
+    try:
+        return int(float(m.group(1)) * _MULT[m.group(2) or ""])
+    except ValueError:
+        return None
+
+def parse_duration_to_seconds(s: str) -> Optional[int]:
+    if s is None: return None
+    s = str(s).strip()
+    m = re.match(r"^(\d+):(\d{1,2})$", s)
+    if m: return int(m.group(1)) * 60 + int(m.group(2))
+    try: return int(round(float(s)))
+    except Exception: return None
+
+# precomposed ελληνικοί/λατινικοί τόνοι -> βάση με ένα translate, χωρίς NFD
+# (το NFD μένει fallback για ό,τι δεν πιάνει ο πίνακας)
+_ACCENT_MAP = str.maketrans(
+    "άέήίόύώϊϋΐΰΆΈΉΊΌΎΏΪΫáéíóúàèìòùâêîôûäëïöüñç",
+    "αεηιουωιυιυΑΕΗΙΟΥΩΙΥaeiouaeiouaeiouaeiounc",
+)
+
+@lru_cache(maxsize=4096)
+def strip_accents(x: str) -> str:
+    # οι περισσότεροι τίτλοι είναι καθαρό ASCII -> κανένας λόγος για NFD + UCD lookups
+    if x.isascii():
+        return x
+    x = x.translate(_ACCENT_MAP)
+    nfd = unicodedata.normalize("NFD", x)
+    if nfd == x:  # τίποτα πια να αφαιρεθεί (π.χ. σκέτα ελληνικά)
+        return x
+    return "".join(c for c in nfd if unicodedata.category(c) != "Mn")
+
+@lru_cache(maxsize=4096)
+def norm_title_preserve_version(t: str) -> str:
+    t = str(t or "").strip().lower()
+    if not t.isascii():
+        t = strip_accents(t)
+    t = _WS_RE.sub(" ", t)
+    return t
+
+def duration_seconds_series(s: pd.Series) -> pd.Series:
+    # vectorized parse_duration_to_seconds: ένα str.extract για όλη τη στήλη,
+    # Int64 αριθμητική, και pd.to_numeric fallback για ό,τι δεν είναι mm:ss
+    txt = s.astype(str).str.strip()
+    m = txt.str.extract(r"^(\d+):(\d{1,2})$")
+    sec = pd.to_numeric(m[0], errors="coerce").astype("Int64") * 60 \
+        + pd.to_numeric(m[1], errors="coerce").astype("Int64")
+    fallback = pd.to_numeric(txt, errors="coerce").round().astype("Int64")
+    return sec.fillna(fallback)
+
+def norm_title_series(s: pd.Series) -> pd.Series:
+    # vectorized norm_title_preserve_version: μία NFKD + strip combining marks σε C,
+    # χωρίς apply(axis=1) / per-row Python
+    return (
+        s.fillna("").astype(str)
+         .str.normalize("NFKD")
+         .str.replace("[\u0300-\u036f]", "", regex=True)  # όχι raw string: το RE2 (Arrow strings) δεν δέχεται \u escapes
+         .str.lower()
+         .str.replace(r"\s+", " ", regex=True)
+         .str.strip()
+    )
+
+def should_exclude(title: str) -> bool:
+    # lowercase + χωρίς τόνους, μετά ένα πέρασμα του compiled alternation
+    return _EXCLUDE_RE.search(norm_title_preserve_version(title)) is not None
+
+def find_tracks_table(soup: BeautifulSoup):
+    for tbl in soup.find_all("table"):
+        # limit=8: οι πίνακες έχουν <8 headers — δεν χρειάζεται unbounded find_all
+        headers = {th.get_text(strip=True).lower() for th in tbl.find_all("th", limit=8)}
+        if {"track", "plays", "duration", "release date"}.issubset(headers):
+            return tbl
+    return None
+
+def extract_img_url(td):
+    # πιάσε URL εικόνας και από lazy attrs — το src είναι η συνηθισμένη περίπτωση,
+    # τα υπόλοιπα μόνο ως or-fallthrough (όχι loop + isinstance ανά attr)
+    img = td.find("img")
+    if not img:
+        return None
+    src = img.get("src") or img.get("data-src") or img.get("data-lazy") or img.get("data-original")
+    if not src or not src.strip():
+        return None
+    if src.startswith("//"):  # protocol-relative
+        src = "https:" + src
+    return src
+
+def table_to_dataframe(tbl: BeautifulSoup) -> pd.DataFrame:
+    # μία C-level ανάγνωση του πίνακα (lxml μέσω read_html) αντί για get_text ανά κελί
+    df = pd.read_html(io.StringIO(str(tbl)), flavor="lxml")[0]
+    df.columns = [str(c).strip().lower().replace(" ", "_") for c in df.columns]
+    df = df.rename(columns={"track": "title"})
+
+    # cover URLs: ένα CSS πέρασμα για το πρώτο <td> κάθε γραμμής,
+    # όχι find_all("td") ανά <tr>
+    covers = [extract_img_url(td) for td in tbl.select("tr > td:first-of-type")]
+    df["cover_url"] = covers if len(covers) == len(df) else None
+
+    # vectorized parse σε όλη τη στήλη· parse_human_int μόνο για ό,τι δεν είναι
+    # σκέτος αριθμός (π.χ. "1.2M")
+    plays = pd.to_numeric(
+        df["plays"].astype(str).str.replace(",", "", regex=False), errors="coerce"
+    )
+    miss = plays.isna()
+    if miss.any():
+        plays[miss] = df.loc[miss, "plays"].map(parse_human_int)
+    df["plays"] = plays.astype("Int64")
+    df = df.dropna(subset=["title", "plays"])
+    return df
+
+# ---------- MAIN ----------
+def main():
+    print("▶ START mmv_daily_total.py")
+    # lxml είναι hard requirement — όχι σιωπηλό fallback στον αργό html.parser·
+    # SoupStrainer: χτίζουμε δέντρο μόνο για τα <table>, όχι για nav/footer/scripts
+    with fetch(ARTIST_URL) as r:
+        # from_encoding: το MMV σερβίρει UTF-8 — κόβουμε το charset detection
+        soup = BeautifulSoup(r.raw, "lxml", parse_only=SoupStrainer("table"),
+                             from_encoding="utf-8")
+
+    tbl = find_tracks_table(soup)
+    if not tbl:
+        print("✗ No valid table found.")
+        return
+
+    df = table_to_dataframe(tbl)
+
+    # 1) Exclude συγκεκριμένους τίτλους (Mouri + Remastered 2005)
+    # normalize μία φορά — το ίδιο Series ξαναχρησιμοποιείται και για το dedupe key
+    before = len(df)
+    norm = norm_title_series(df["title"])
+    # μέσω Python re, όχι str.contains: σε Arrow-backed strings το contains
+    # περνάει το pattern στο RE2, όπου το \b είναι ASCII-only και τα ελληνικά
+    # patterns δεν θα έπιαναν ποτέ
+    mask = norm.map(lambda t: _EXCLUDE_RE.search(t) is not None)
+    df = df.loc[~mask]
+    norm = norm.loc[~mask]
+    removed = before - len(df)
+    print(f"[exclude] removed={removed}")
+
+    # 2) Save RAW της ημέρας
+    today_str = dt.date.today().strftime("%Y-%m-%d")
+    os.makedirs(OUT_TRACKS_DIR, exist_ok=True)
+    raw_path = os.path.join(OUT_TRACKS_DIR, f"mmv_track_streams_{today_str}.csv")
+    # machine-consumed αρχεία: σκέτο utf-8 χωρίς BOM (το utf-8-sig μένει μόνο
+    # στο user-facing totals CSV για το Excel)
+    df.to_csv(raw_path, index=False, encoding="utf-8", lineterminator="\n")
+    print(f"[save] RAW -> {raw_path} (rows={len(df)})")
+
+    # 3) DEDUPE: ίδιος normalized τίτλος + ίδια διάρκεια => κρατάμε max plays
+    # (το ήδη υπολογισμένο norm μπαίνει ως στήλη — μετά το RAW save, για να μην
+    # αλλάξει το schema του raw CSV)
+    df["_norm_title"] = norm
+    # fillna("None") πριν το concat: NA διάρκεια θα έδινε NaN _key, και το
+    # drop_duplicates θα κατέρρεε όλα τα NaN keys σε μία γραμμή (χαμένα plays)·
+    # το "None" κρατάει και τα παλιά f-string semantics του make_dedupe_key
+    dur_sec = duration_seconds_series(df["duration"])
+    df["_key"] = df["_norm_title"].str.cat(dur_sec.astype("string").fillna("None"), sep="|")
+    # sorted κατά plays desc + keep="first" ισοδυναμεί με το παλιό groupby/agg
+    # (max plays, first για τις υπόλοιπες στήλες) αλλά σε ένα hash pass
+    df_dedup = (
+        df.sort_values("plays", ascending=False, kind="stable")
+          .drop_duplicates(subset=["_key"], keep="first", ignore_index=True)
+          [["_key", "title", "plays", "duration", "release_date", "cover_url"]]
+    )
+
+    # 4) (προαιρετική) αρίθμηση για ευκολότερο display στο app
+    df_dedup.insert(0, "No", range(1, len(df_dedup) + 1))
+
+    # το _key γράφεται και στο CSV: το app κάνει το today-vs-prev join πάνω του
+    # χωρίς να ξανα-κανονικοποιεί τίτλους σε κάθε rerun
+    dedup_path = os.path.join(OUT_TRACKS_DIR, f"mmv_track_streams_{today_str}_deduped.csv")
+    df_dedup.to_csv(dedup_path, index=False, encoding="utf-8", lineterminator="\n")
+    print(f"[save] DEDUPED -> {dedup_path} (rows={len(df_dedup)})")
+
+    # parquet sidecar για το dashboard: typed columnar read, χωρίς CSV parse/fixups
+    # (το CSV μένει το user-facing αρχείο — physical data independence)
+    pq_path = dedup_path[:-4] + ".parquet"
+    try:
+        df_dedup.to_parquet(pq_path, index=False)
+        print(f"[save] PARQUET -> {pq_path}")
+    except Exception as e:
+        print(f"[save] parquet sidecar skipped: {e}")
+
+    # 5) Σύνολο (χωρίς τα excluded + χωρίς duplicates)
+    deduped_total = int(df_dedup["plays"].sum())  # Int64 C-kernel sum, null-skip
+    print(f"[total] deduped_total={deduped_total:,}")
+
+    # 6) Ενημέρωση/αντικατάσταση σημερινής γραμμής στο totals CSV
+    # κοινή περίπτωση = append μίας γραμμής: διαβάζουμε μόνο το tail του αρχείου,
+    # όχι όλο το CSV — full rewrite μόνο αν υπάρχει ήδη σημερινή γραμμή
+    header = "date,total_plays,daily_delta,source\n"
+    today_prefix = today_str + ","
+
+    tail = ""
+    if os.path.exists(OUT_TOTAL_CSV):
+        size = os.path.getsize(OUT_TOTAL_CSV)
+        with open(OUT_TOTAL_CSV, "rb") as f:
+            f.seek(max(0, size - 4096))
+            tail = f.read().decode("utf-8-sig", errors="replace")
+    tail_lines = [ln for ln in tail.splitlines() if ln.strip()]
+
+    prev_total = None
+    for ln in reversed(tail_lines):
+        if not ln.startswith("date,") and not ln.startswith(today_prefix):
+            try:
+                prev_total = int(ln.split(",")[1])
+                break
+            except Exception:
+                pass
+
+    daily_delta = 0 if prev_total is None else (deduped_total - prev_total)
+    today_line = f"{today_prefix}{deduped_total},{daily_delta},MusicMetricsVault.com (personal use)\n"
+
+    if not tail_lines:
+        with open(OUT_TOTAL_CSV, "w", encoding="utf-8-sig") as f:
+            f.write(header + today_line)
+    elif not any(ln.startswith(today_prefix) for ln in tail_lines):
+        with open(OUT_TOTAL_CSV, "a", encoding="utf-8") as f:
+            if tail and not tail.endswith("\n"):
+                f.write("\n")
+            f.write(today_line)
+    else:
+        # δεύτερο run της ίδιας μέρας: αντικατάσταση γραμμής -> full rewrite
+        with open(OUT_TOTAL_CSV, "r", encoding="utf-8-sig") as f:
+            lines = [ln for ln in f.readlines() if ln.strip()]
+        # ένα forward pass: date -> index, αντί για reverse scan με startswith
+        idx_by_date = {
+            ln.split(",", 1)[0]: i
+            for i, ln in enumerate(lines)
+            if not ln.startswith("date,")
+        }
+        i = idx_by_date.get(today_str)
+        if i is None:
+            lines.append(today_line)
+        else:
+            lines[i] = today_line
+        with open(OUT_TOTAL_CSV, "w", encoding="utf-8-sig") as f:
+            if not lines[0].startswith("date,"):
+                f.write(header)
+            f.writelines([ln if ln.endswith("\n") else (ln + "\n") for ln in lines])
+
+    print("✅ DONE")
+
+if __name__ == "__main__":
     main()
\ No newline at end of file